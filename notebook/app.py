@@ -1,5 +1,6 @@
 import streamlit as st
-from fuzzy_system import build_system
+from fuzzy_system import score_sample
+from recommendations import generate_recommendations, risk_level
 
 # -------------------------------------------------
 # Page configuration
@@ -21,68 +22,25 @@ st.markdown(
 )
 
 # -------------------------------------------------
-# Build fuzzy system once
+# Cached inference
 # -------------------------------------------------
-_, sim = build_system()
-
-# -------------------------------------------------
-# Recommendation function
-# -------------------------------------------------
-def generate_recommendations(
-    risk_score,
-    bmi_real,
-    age_real,
-    highbp,
-    smoker,
-    physact,
-    highchol,
-    heart,
-    genhlth_label
-):
-    recs = []
-
-    # --- Risk-level advice ---
-    if risk_score < 0.2:
-        recs.append("🟢 Maintain your current healthy lifestyle.")
-    elif risk_score < 0.4:
-        recs.append("🟡 Monitor your health regularly and maintain healthy habits.")
-    elif risk_score < 0.6:
-        recs.append("🟠 Lifestyle improvements are recommended to reduce diabetes risk.")
-    elif risk_score < 0.8:
-        recs.append("🔴 High risk detected. Medical consultation is strongly recommended.")
-    else:
-        recs.append("⚫ Very high risk detected. Immediate medical follow-up is advised.")
-
-    # --- Factor-specific recommendations ---
-    if bmi_real >= 30:
-        recs.append("⚠️ BMI indicates obesity. Weight management through diet and exercise is recommended.")
-    elif bmi_real >= 25:
-        recs.append("⚠️ BMI indicates overweight. Gradual weight reduction is advised.")
-
-    if highbp == 1:
-        recs.append("⚠️ High blood pressure detected. Reduce salt intake and consult a healthcare provider.")
-
-    if smoker == 1:
-        recs.append("⚠️ Smoking increases insulin resistance. Smoking cessation is strongly advised.")
-
-    if physact == 0:
-        recs.append("⚠️ Low physical activity detected. At least 150 minutes of moderate exercise per week is recommended.")
-
-    if highchol == 1:
-        recs.append("⚠️ High cholesterol detected. Dietary fat reduction and medical advice are recommended.")
-
-    if heart == 1:
-        recs.append("⚠️ History of heart disease significantly increases diabetes risk. Regular medical monitoring is essential.")
-
-    if genhlth_label in ["Fair", "Poor"]:
-        recs.append("⚠️ Poor general health reported. A comprehensive health evaluation is recommended.")
-
-    # --- Protective feedback ---
-    if smoker == 0 and physact == 1 and bmi_real < 25:
-        recs.append("✅ Protective factors detected: non-smoker, active lifestyle, and healthy BMI.")
-
-    return recs
-
+# score_sample builds the fuzzy system once per process and shares it
+# across sessions under a lock, so one session's inputs never reach
+# another session's compute.
+# Sliders are discrete (integer age, BMI in tenths, categorical inputs),
+# so the keys below are exact and repeated evaluations are cache hits.
+@st.cache_data(max_entries=4096)
+def evaluate_risk(age_int, bmi_tenths, genhlth_real, HighBP, Smoker,
+                  PhysActivity, HighChol, HeartDisease):
+    age_norm = (age_int - 18) / (90 - 18)
+    bmi_norm = (bmi_tenths / 10 - 15) / (45 - 15)
+    genhlth_norm = (genhlth_real - 1) / 4
+
+    return score_sample(
+        bmi_norm, age_norm,
+        HighBP, Smoker, PhysActivity, HighChol, HeartDisease,
+        genhlth_norm
+    )
 
 # -------------------------------------------------
 # Sidebar inputs (REAL VALUES)
@@ -151,49 +109,26 @@ HeartDisease = st.sidebar.selectbox(
     format_func=lambda x: "Yes" if x == 1 else "No"
 )
 
-# -------------------------------------------------
-# Normalize inputs (INTERNAL USE)
-# -------------------------------------------------
-age_norm = (age_real - 18) / (90 - 18)
-bmi_norm = (bmi_real - 15) / (45 - 15)
-genhlth_norm = (genhlth_real - 1) / 4
-
-
 # -------------------------------------------------
 # Run inference
 # -------------------------------------------------
 if st.button("🔍 Evaluate Diabetes Risk"):
     try:
-        sim.reset()
-
-        sim.input['Age'] = age_norm
-        sim.input['BMI'] = bmi_norm
-        sim.input['GenHlth'] = genhlth_norm
-        sim.input['HighBP'] = HighBP
-        sim.input['Smoker'] = Smoker
-        sim.input['PhysActivity'] = PhysActivity
-        sim.input['HighChol'] = HighChol
-        sim.input['HeartDiseaseorAttack'] = HeartDisease
-
-        sim.compute()
-        risk_score = float(sim.output['Risk'])
-
-        # Risk level
-        if risk_score < 0.2:
-            risk_level = "🟢 Very Low"
-        elif risk_score < 0.4:
-            risk_level = "🟡 Low"
-        elif risk_score < 0.6:
-            risk_level = "🟠 Medium"
-        elif risk_score < 0.8:
-            risk_level = "🔴 High"
-        else:
-            risk_level = "⚫ Very High"
+        risk_score = evaluate_risk(
+            int(age_real),
+            int(round(bmi_real * 10)),
+            genhlth_real,
+            HighBP,
+            Smoker,
+            PhysActivity,
+            HighChol,
+            HeartDisease
+        )
 
         # Display results
         st.success("Assessment Completed")
         st.metric("Diabetes Risk Score", f"{risk_score:.3f}")
-        st.markdown(f"### Risk Level: **{risk_level}**")
+        st.markdown(f"### Risk Level: **{risk_level(risk_score)}**")
 
         # Personalized recommendations
         st.subheader("📌 Personalized Recommendations")
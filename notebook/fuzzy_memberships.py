@@ -1,10 +1,7 @@
+import json
 import os
+import tempfile
 import numpy as np
-import skfuzzy as fuzz
-try:
-	import pandas as pd
-except Exception:
-	pd = None
 
 # -------------------------------------------------------------
 # Data-driven membership functions using dataset percentiles
@@ -22,20 +19,64 @@ def _compute_quantiles(series):
 	q3 = float(s.quantile(0.75))
 	return float(s.min()), q1, q2, q3, float(s.max())
 
-def _load_data_quantiles():
+_DATA_PATH = os.path.join(os.path.dirname(__file__), '..', 'data', 'diabetes_clean.csv')
+_QUANTILE_CACHE = os.path.join(os.path.dirname(__file__), '_quantile_cache.json')
+
+def _data_stamp(path):
+	st = os.stat(path)
+	return {'size': st.st_size, 'mtime': st.st_mtime}
+
+_QUANTILE_COLUMNS = ['BMI', 'Age', 'GenHlth']
+
+def _read_data_quantiles(data_path):
+	import pandas as pd
+	# Parse only the columns the breakpoints come from. They stay float64:
+	# float32 would shift the quantiles, and with them every membership.
+	df = pd.read_csv(data_path, usecols=lambda c: c in _QUANTILE_COLUMNS, dtype=np.float64)
 	q = {}
+	for col in _QUANTILE_COLUMNS:
+		if col in df.columns:
+			q[col] = _compute_quantiles(df[col])
+		else:
+			q[col] = (0.0, 0.25, 0.5, 0.75, 1.0)
+	return q
+
+def _load_data_quantiles():
+	# The quantiles only change with the CSV, so they are cached on disk
+	# keyed by its size/mtime; a hit skips pandas and the CSV parse entirely.
 	try:
-		if pd is None:
-			raise RuntimeError("pandas not available")
-		data_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'diabetes_clean.csv')
-		df = pd.read_csv(data_path)
-		for col in ['BMI', 'Age', 'GenHlth']:
-			if col in df.columns:
-				q[col] = _compute_quantiles(df[col])
-			else:
-				q[col] = (0.0, 0.25, 0.5, 0.75, 1.0)
+		stamp = _data_stamp(_DATA_PATH)
+	except OSError:
+		stamp = None
+	if stamp is not None:
+		try:
+			with open(_QUANTILE_CACHE) as f:
+				cached = json.load(f)
+			if cached['stamp'] == stamp:
+				return {col: tuple(v) for col, v in cached['quantiles'].items()}
+		except Exception:
+			pass
+	try:
+		q = _read_data_quantiles(_DATA_PATH)
 	except Exception:
-		q = {col: (0.0, 0.25, 0.5, 0.75, 1.0) for col in ['BMI', 'Age', 'GenHlth']}
+		return {col: (0.0, 0.25, 0.5, 0.75, 1.0) for col in _QUANTILE_COLUMNS}
+	# Write to a temp file and swap it in, so a process starting
+	# concurrently never reads a half-written cache
+	try:
+		fd, tmp = tempfile.mkstemp(dir=os.path.dirname(_QUANTILE_CACHE),
+		                           prefix=os.path.basename(_QUANTILE_CACHE) + '.', suffix='.tmp')
+	except OSError:
+		return q
+	try:
+		with os.fdopen(fd, 'w') as f:
+			json.dump({'stamp': stamp, 'quantiles': q}, f)
+		os.chmod(tmp, 0o644)  # mkstemp creates it owner-only
+		os.replace(tmp, _QUANTILE_CACHE)
+	except OSError:
+		try:
+			os.unlink(tmp)
+		except OSError:
+			pass
 	return q
 
 _Q = _load_data_quantiles()
@@ -49,45 +90,112 @@ bmi_universe = np.linspace(_bmi_min, _bmi_max, 101)
 age_universe = np.linspace(_age_min, _age_max, 101)
 genhlth_universe = np.linspace(_gh_min, _gh_max, 101)
 
-# BMI membership functions (percentile-based)
-bmi_under   = fuzz.trimf(bmi_universe,   [_bmi_min, _bmi_min, _bmi_q1])
-bmi_healthy = fuzz.trimf(bmi_universe,   [_bmi_q1, _bmi_q2, _bmi_q3])
-bmi_over    = fuzz.trimf(bmi_universe,   [_bmi_q2, (_bmi_q2+_bmi_q3)/2.0, _bmi_max])
-bmi_obese   = fuzz.trapmf(bmi_universe,  [_bmi_q3, (_bmi_q3+_bmi_max)/2.0, _bmi_max, _bmi_max])
-
-# Age membership functions (percentile-based)
-age_young  = fuzz.trimf(age_universe,  [_age_min, _age_min, _age_q2])
-age_middle = fuzz.trimf(age_universe,  [_age_q1, _age_q2, _age_q3])
-age_old    = fuzz.trapmf(age_universe, [_age_q3, (_age_q3+_age_max)/2.0, _age_max, _age_max])
-
-# HighBP (binary)
-bp_normal = fuzz.trimf(binary_universe, [0.0, 0.0, 0.5])
-bp_high   = fuzz.trimf(binary_universe, [0.5, 1.0, 1.0])
-
-# Smoker (binary)
-smoke_no  = fuzz.trimf(binary_universe, [0.0, 0.0, 0.5])
-smoke_yes = fuzz.trimf(binary_universe, [0.5, 1.0, 1.0])
-
-# PhysActivity (binary)
-act_inactive = fuzz.trimf(binary_universe, [0.0, 0.0, 0.5])
-act_active   = fuzz.trimf(binary_universe, [0.5, 1.0, 1.0])
-
-# HighChol (binary)
-chol_normal = fuzz.trimf(binary_universe, [0.0, 0.0, 0.5])
-chol_high   = fuzz.trimf(binary_universe, [0.5, 1.0, 1.0])
-
-# HeartDiseaseorAttack (binary)
-cardio_no   = fuzz.trimf(binary_universe, [0.0, 0.0, 0.5])
-cardio_yes  = fuzz.trimf(binary_universe, [0.5, 1.0, 1.0])
-
-# GenHlth (percentile-based)
-genhlth_good = fuzz.trimf(genhlth_universe, [_gh_min, _gh_min, _gh_q1])
-genhlth_avg  = fuzz.trimf(genhlth_universe, [_gh_q1, _gh_q2, _gh_q3])
-genhlth_poor = fuzz.trapmf(genhlth_universe, [_gh_q3, (_gh_q3+_gh_max)/2.0, _gh_max, _gh_max])
-
-# Risk Output (fixed scale 0–1)
-risk_vlow  = fuzz.trimf(risk_universe, [0.0, 0.0, 0.2])
-risk_low   = fuzz.trimf(risk_universe, [0.1, 0.25, 0.4])
-risk_med   = fuzz.trimf(risk_universe, [0.3, 0.5, 0.7])
-risk_high  = fuzz.trimf(risk_universe, [0.6, 0.75, 0.9])
-risk_vhigh = fuzz.trimf(risk_universe, [0.8, 1.0, 1.0])
+# -------------------------------------------------------------
+# Term parameters (SoA): one (n_terms, 4) float64 block per variable,
+# term order as in build_system. Triangles leave the 4th column NaN.
+# -------------------------------------------------------------
+TRIMF, TRAPMF = 0, 1
+_NA = np.nan
+
+# All five binary inputs share one parameter set, kind list and table
+_BIN_PARAMS = np.array([[0.0, 0.0, 0.5, _NA],
+                        [0.5, 1.0, 1.0, _NA]])
+_BIN_KIND = np.array([TRIMF, TRIMF])
+
+TERM_PARAMS = {
+	# BMI membership functions (percentile-based)
+	'BMI': np.array([[_bmi_min, _bmi_min, _bmi_q1, _NA],
+	                 [_bmi_q1, _bmi_q2, _bmi_q3, _NA],
+	                 [_bmi_q2, (_bmi_q2+_bmi_q3)/2.0, _bmi_max, _NA],
+	                 [_bmi_q3, (_bmi_q3+_bmi_max)/2.0, _bmi_max, _bmi_max]]),
+	# Age membership functions (percentile-based)
+	'Age': np.array([[_age_min, _age_min, _age_q2, _NA],
+	                 [_age_q1, _age_q2, _age_q3, _NA],
+	                 [_age_q3, (_age_q3+_age_max)/2.0, _age_max, _age_max]]),
+	# Binary inputs: normal/no/inactive, high/yes/active
+	'HighBP': _BIN_PARAMS,
+	'Smoker': _BIN_PARAMS,
+	'PhysActivity': _BIN_PARAMS,
+	'HighChol': _BIN_PARAMS,
+	'HeartDiseaseorAttack': _BIN_PARAMS,
+	# GenHlth (percentile-based)
+	'GenHlth': np.array([[_gh_min, _gh_min, _gh_q1, _NA],
+	                     [_gh_q1, _gh_q2, _gh_q3, _NA],
+	                     [_gh_q3, (_gh_q3+_gh_max)/2.0, _gh_max, _gh_max]]),
+	# Risk Output (fixed scale 0–1)
+	'Risk': np.array([[0.0, 0.0, 0.2, _NA],
+	                  [0.1, 0.25, 0.4, _NA],
+	                  [0.3, 0.5, 0.7, _NA],
+	                  [0.6, 0.75, 0.9, _NA],
+	                  [0.8, 1.0, 1.0, _NA]]),
+}
+
+TERM_KIND = {
+	'BMI': np.array([TRIMF, TRIMF, TRIMF, TRAPMF]),
+	'Age': np.array([TRIMF, TRIMF, TRAPMF]),
+	'HighBP': _BIN_KIND,
+	'Smoker': _BIN_KIND,
+	'PhysActivity': _BIN_KIND,
+	'HighChol': _BIN_KIND,
+	'HeartDiseaseorAttack': _BIN_KIND,
+	'GenHlth': np.array([TRIMF, TRIMF, TRAPMF]),
+	'Risk': np.array([TRIMF, TRIMF, TRIMF, TRIMF, TRIMF]),
+}
+
+def trimf_vec(x, a, b, c):
+	"""skfuzzy.trimf for broadcast breakpoints, without per-term branching."""
+	with np.errstate(divide='ignore', invalid='ignore'):
+		y = np.where((a < x) & (x < b), (x - a) / (b - a), 0.0)
+		y = np.where((b < x) & (x < c), (c - x) / (c - b), y)
+	return np.where(x == b, 1.0, y)
+
+def trapmf_vec(x, a, b, c, d):
+	"""skfuzzy.trapmf for broadcast breakpoints, without per-term branching."""
+	y = np.where(x <= b, trimf_vec(x, a, b, b), 1.0)
+	return np.where(x >= c, trimf_vec(x, c, c, d), y)
+
+def evaluate_terms(x, params, kinds):
+	"""Memberships of x in every term of a variable, shape (n_terms, len(x))."""
+	x = np.asarray(x, dtype=np.float64)[None, :]
+	a, b, c, d = (params[:, i, None] for i in range(4))
+	return np.where((kinds == TRAPMF)[:, None],
+	                trapmf_vec(x, a, b, c, d), trimf_vec(x, a, b, c))
+
+# -------------------------------------------------------------
+# Membership lookup tables: (n_terms, 101), term order as in build_system
+# -------------------------------------------------------------
+bmi_mf_table     = evaluate_terms(bmi_universe, TERM_PARAMS['BMI'], TERM_KIND['BMI'])
+age_mf_table     = evaluate_terms(age_universe, TERM_PARAMS['Age'], TERM_KIND['Age'])
+_bin_mf_table    = evaluate_terms(binary_universe, _BIN_PARAMS, _BIN_KIND)
+bp_mf_table = smoke_mf_table = act_mf_table = chol_mf_table = cardio_mf_table = _bin_mf_table
+genhlth_mf_table = evaluate_terms(genhlth_universe, TERM_PARAMS['GenHlth'], TERM_KIND['GenHlth'])
+risk_mf_table    = evaluate_terms(risk_universe, TERM_PARAMS['Risk'], TERM_KIND['Risk'])
+
+# Per-term names (views into the tables above)
+bmi_under, bmi_healthy, bmi_over, bmi_obese = bmi_mf_table
+age_young, age_middle, age_old = age_mf_table
+_bin_low, _bin_high = _bin_mf_table
+bp_normal = smoke_no = act_inactive = chol_normal = cardio_no = _bin_low
+bp_high = smoke_yes = act_active = chol_high = cardio_yes = _bin_high
+genhlth_good, genhlth_avg, genhlth_poor = genhlth_mf_table
+risk_vlow, risk_low, risk_med, risk_high, risk_vhigh = risk_mf_table
+
+def membership(x, table, universe):
+	"""Memberships of an (N,) input in every term of table, shape (n_terms, N).
+
+	Universes are uniform grids, so each input's segment is found by
+	arithmetic rather than a search; interpolating inside it reproduces
+	skfuzzy.interp_membership (inputs clipped to the universe) exactly.
+	"""
+	x = np.asarray(x, dtype=np.float64)
+	lo, hi, n = universe[0], universe[-1], len(universe) - 1
+	if hi == lo:
+		return table[:, np.zeros(len(x), dtype=np.int64)]
+	x = np.clip(x, lo, hi)
+	idx = np.minimum(np.nan_to_num((x - lo) * (n / (hi - lo))).astype(np.int64), n - 1)
+	# Nudge the index where rounding put x in a neighbouring segment
+	idx -= (idx > 0) & (x < universe[idx])
+	idx += (idx < n - 1) & (x >= universe[np.minimum(idx + 1, n)])
+	x0, x1 = universe[idx], universe[idx + 1]
+	y0, y1 = table[:, idx], table[:, idx + 1]
+	return np.where(x == hi, table[:, [n]], (y1 - y0) / (x1 - x0) * (x - x0) + y0)
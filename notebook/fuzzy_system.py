@@ -2,24 +2,22 @@
 Fuzzy Rule-Based Medical Diagnosis System for Diabetes Risk
 """
 
-import argparse
-import time
+from __future__ import annotations
+
+import threading
 import warnings
-from typing import Tuple
+from functools import lru_cache
+from typing import TYPE_CHECKING, List, NamedTuple, Tuple
 
 import numpy as np
-import pandas as pd
 import skfuzzy.control as ctrl
-from sklearn.metrics import (
-    accuracy_score,
-    precision_score,
-    recall_score,
-    f1_score,
-    confusion_matrix,
-    roc_curve,
-    auc,
-    precision_recall_curve,
-)
+from skfuzzy.control.term import TermAggregate
+
+# pandas, sklearn, argparse and time are only needed by the batch script
+# (main), and numba only by compute_scores; importing them lazily keeps
+# the Streamlit app's startup light.
+if TYPE_CHECKING:
+    import pandas as pd
 
 warnings.filterwarnings("ignore", category=UserWarning)
 
@@ -43,13 +41,21 @@ from fuzzy_memberships import (
     genhlth_good, genhlth_avg, genhlth_poor,
 
     risk_vlow, risk_low, risk_med, risk_high, risk_vhigh,
+
+    membership,
 )
 
 
 # ------------------------------------------------------------
 # Build fuzzy system
 # ------------------------------------------------------------
-def build_system() -> Tuple[ctrl.ControlSystem, ctrl.ControlSystemSimulation]:
+def build_system(defuzzify_method: str = 'centroid') -> Tuple[ctrl.ControlSystem, ctrl.ControlSystemSimulation]:
+    """Build the Mamdani system and a simulation for it.
+
+    defuzzify_method='simplified' selects the weighted average of the risk
+    term centroids; only the batch engine (compute_scores) implements it,
+    skfuzzy's own simulation requires 'centroid'.
+    """
 
     # ---------- Antecedents ----------
     bmi = ctrl.Antecedent(bmi_universe, 'BMI')
@@ -62,7 +68,7 @@ def build_system() -> Tuple[ctrl.ControlSystem, ctrl.ControlSystemSimulation]:
     genhlth = ctrl.Antecedent(genhlth_universe, 'GenHlth')
 
     # ---------- Consequent ----------
-    risk = ctrl.Consequent(risk_universe, 'Risk', defuzzify_method='centroid')
+    risk = ctrl.Consequent(risk_universe, 'Risk', defuzzify_method=defuzzify_method)
 
     # ---------- Assign membership functions ----------
     bmi['under'] = bmi_under
@@ -155,76 +161,451 @@ def build_system() -> Tuple[ctrl.ControlSystem, ctrl.ControlSystemSimulation]:
     return system, sim
 
 
+_SYSTEM_CACHE = None
+_BUILD_LOCK = threading.Lock()
+# The simulation is mutable state: callers sharing it across threads
+# (the Streamlit sessions) must hold this around reset/compute/read.
+_SIM_LOCK = threading.Lock()
+
+
+def get_or_build_system() -> Tuple[ctrl.ControlSystem, ctrl.ControlSystemSimulation]:
+    """Process-wide (system, sim) pair, built on first use."""
+    global _SYSTEM_CACHE
+    with _BUILD_LOCK:
+        if _SYSTEM_CACHE is None:
+            _SYSTEM_CACHE = build_system()
+    return _SYSTEM_CACHE
+
+
+# ------------------------------------------------------------
+# Vectorized Mamdani engine
+# ------------------------------------------------------------
+# The NumPy path evaluates rows in blocks so the (rows x universe) aggregation
+# buffers stay small regardless of the dataset size.
+BATCH_SIZE = 4096
+
+# skfuzzy inserts the cut points of every clipped output term before
+# integrating; defuzzifying on a 4x finer output universe instead keeps
+# batch scores within ~1e-4 of the per-row simulation.
+DEFUZZ_OVERSAMPLE = 4
+
+
+class FuzzyEngine(NamedTuple):
+    inputs: List[str]                                # antecedent labels, column order
+    universes: List[np.ndarray]
+    tables: List[np.ndarray]                         # (n_terms, len(universe)) per input
+    offsets: np.ndarray                              # first column of each input in M
+    binary: np.ndarray                               # inputs whose (low, high) terms are 1-x, x on {0, 1}
+    rule_mask: np.ndarray                            # (n_rules, total_terms) AND-ed columns of M
+    rule_out: np.ndarray                             # (n_rules, n_out_terms) consequent terms
+    out_universe: np.ndarray
+    out_mfs: np.ndarray                              # (n_out_terms, len(out_universe))
+    out_centroids: np.ndarray                        # centroid of each output term
+    defuzzify_method: str                            # 'centroid' or 'simplified'
+
+
+def _and_terms(antecedent):
+    if isinstance(antecedent, TermAggregate):
+        if antecedent.kind != 'and':
+            raise ValueError(f"Unsupported rule connective: {antecedent.kind}")
+        return _and_terms(antecedent.term1) + _and_terms(antecedent.term2)
+    return [(antecedent.parent.label, antecedent.label)]
+
+
+def compile_system(system: ctrl.ControlSystem) -> FuzzyEngine:
+    """Flatten a single-output, AND-only rule base into rule matrices.
+
+    Memberships are taken from the sampled term arrays of the system, so
+    batch results match ControlSystemSimulation row by row. Universes must
+    be uniform grids: fuzzification indexes them arithmetically.
+    """
+    antecedents = sorted(system.antecedents, key=lambda a: a.label)
+    (consequent,) = system.consequents
+    if consequent.defuzzify_method not in ('centroid', 'simplified'):
+        raise ValueError(f"Unsupported defuzzify_method: {consequent.defuzzify_method}")
+
+    for a in antecedents:
+        step = np.diff(a.universe)
+        if not np.allclose(step, step[0]):
+            raise ValueError(f"Universe of {a.label} is not a uniform grid")
+
+    sizes = [len(a.terms) for a in antecedents]
+    offsets = np.concatenate([[0], np.cumsum(sizes)[:-1]]).astype(np.intp)
+    col = {(a.label, term): offsets[k] + j
+           for k, a in enumerate(antecedents) for j, term in enumerate(a.terms)}
+
+    out_names = list(consequent.terms)
+    rules = list(system.rules)
+    rule_mask = np.zeros((len(rules), sum(sizes)), dtype=bool)
+    rule_out = np.zeros((len(rules), len(out_names)), dtype=bool)
+    for r, rule in enumerate(rules):
+        for t in _and_terms(rule.antecedent):
+            rule_mask[r, col[t]] = True
+        for c in rule.consequent:
+            rule_out[r, out_names.index(c.term.label)] = True
+
+    universe = np.asarray(consequent.universe, dtype=np.float64)
+    out_universe = np.linspace(universe[0], universe[-1],
+                               (len(universe) - 1) * DEFUZZ_OVERSAMPLE + 1)
+    out_mfs = np.stack([np.interp(out_universe, universe, t.mf)
+                        for t in consequent.terms.values()])
+
+    universes = [np.asarray(a.universe, dtype=np.float64) for a in antecedents]
+    tables = [np.stack([t.mf for t in a.terms.values()]).astype(np.float64)
+              for a in antecedents]
+    binary = np.array([
+        len(t) == 2 and u[0] == 0.0 and u[-1] == 1.0
+        and np.array_equal(t[:, 0], [1.0, 0.0]) and np.array_equal(t[:, -1], [0.0, 1.0])
+        for u, t in zip(universes, tables)
+    ])
+
+    return FuzzyEngine(
+        inputs=[a.label for a in antecedents],
+        universes=universes,
+        tables=tables,
+        offsets=offsets,
+        binary=binary,
+        rule_mask=rule_mask,
+        rule_out=rule_out,
+        out_universe=out_universe,
+        out_mfs=out_mfs,
+        out_centroids=_centroid(out_universe, out_mfs),
+        defuzzify_method=consequent.defuzzify_method,
+    )
+
+
+def _centroid(x: np.ndarray, mf: np.ndarray) -> np.ndarray:
+    # Exact centroid of the piecewise-linear curve through (x, mf[i]),
+    # the same integration skfuzzy.defuzz performs per sample.
+    dx = np.diff(x)
+    y1, y2 = mf[:, :-1], mf[:, 1:]
+    area = (dx * (y1 + y2)).sum(axis=1) / 2.0
+    moment = (dx * (x[:-1] * (2 * y1 + y2) + x[1:] * (y1 + 2 * y2))).sum(axis=1) / 6.0
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(area > 0, moment / area, np.nan)
+
+
+def _kernel_args(engine: FuzzyEngine) -> tuple:
+    # Pad the per-input universes/tables and the rule term lists into the
+    # fixed-shape arrays fuzzy_infer_batch is compiled for
+    n_points = np.array([len(u) for u in engine.universes], dtype=np.int64)
+    universes = np.zeros((len(n_points), n_points.max()))
+    for k, u in enumerate(engine.universes):
+        universes[k, :len(u)] = u
+    tables = np.zeros((engine.rule_mask.shape[1], n_points.max()))
+    for k, t in enumerate(engine.tables):
+        tables[engine.offsets[k]:engine.offsets[k] + len(t), :t.shape[1]] = t
+
+    rule_terms = np.full((len(engine.rule_mask), engine.rule_mask.sum(axis=1).max()), -1,
+                         dtype=np.int64)
+    for r, mask in enumerate(engine.rule_mask):
+        cols = np.flatnonzero(mask)
+        rule_terms[r, :len(cols)] = cols
+
+    return (universes, n_points, tables,
+            engine.offsets.astype(np.int64),
+            np.array([len(t) for t in engine.tables], dtype=np.int64),
+            engine.binary.astype(np.bool_),
+            rule_terms, engine.rule_out,
+            engine.out_universe, engine.out_mfs, engine.out_centroids,
+            engine.defuzzify_method == 'simplified')
+
+
+@lru_cache(maxsize=None)
+def _fused_kernel():
+    # Imported on first batch call: loading mf_numba compiles the kernel
+    try:
+        from mf_numba import fuzzy_infer_batch
+    except ImportError:
+        return None
+    return fuzzy_infer_batch
+
+
+def infer_batch(engine: FuzzyEngine, X: np.ndarray) -> np.ndarray:
+    """Risk scores for an (N, n_inputs) matrix ordered like engine.inputs.
+
+    Missing (NaN) inputs follow skfuzzy, whose fmin/fmax ignore NaN: their
+    memberships are left out of every AND. Rows that no rule fires for
+    score 0.5, as in the per-row fallback; so do rows where all rules
+    concluding some output term reference only missing inputs, for which
+    the simulation itself returns NaN.
+    """
+    n = len(X)
+    total = int(engine.offsets[-1]) + len(engine.tables[-1])
+
+    # Fuzzify: (N, total_terms), inputs clipped to their universe as skfuzzy does
+    M = np.empty((n, total))
+    for k, (universe, table) in enumerate(zip(engine.universes, engine.tables)):
+        cols = slice(engine.offsets[k], engine.offsets[k] + len(table))
+        x = X[:, k]
+        if engine.binary[k] and np.all((x == 0.0) | (x == 1.0)):
+            # 0/1 inputs sit on the universe ends: memberships are exactly x, 1 - x
+            M[:, cols.start] = 1.0 - x
+            M[:, cols.start + 1] = x
+        else:
+            M[:, cols] = membership(x, table, universe).T
+
+    # AND: masked fmin over the term columns of each rule -> (N, n_rules);
+    # OR: fmax over the rules concluding each output term -> (N, n_out_terms).
+    # Both skip NaN memberships like skfuzzy's and_func/accumulation do.
+    # Rules referencing a term no row in the block belongs to cannot fire,
+    # so they are dropped before the (N, n_rules, total_terms) reduction.
+    live = ~(engine.rule_mask & ~M.any(axis=0)).any(axis=1)
+    rule_mask, rule_out = engine.rule_mask[live], engine.rule_out[live]
+    # (+inf stands in for NaN so the plain min can be used: it loses to any
+    # real membership and survives only if all of a rule's terms are NaN)
+    firing = np.where(rule_mask, np.nan_to_num(M, nan=np.inf)[:, None, :], np.inf).min(axis=2)
+    firing[firing == np.inf] = np.nan
+    cut = np.fmax.reduce(np.where(rule_out, firing[:, :, None], np.nan), axis=1,
+                         initial=np.nan)
+    # A dropped rule fires exactly 0; a term no rule concludes stays empty
+    settled = engine.rule_out[~live].any(axis=0) | ~engine.rule_out.any(axis=0)
+    cut[:, settled] = np.fmax(cut[:, settled], 0.0)
+
+    if engine.defuzzify_method == 'simplified':
+        # Height method: O(n_out_terms) per row instead of integrating
+        with np.errstate(divide='ignore', invalid='ignore'):
+            scores = (cut * engine.out_centroids).sum(axis=1) / cut.sum(axis=1)
+        return np.where(np.isfinite(scores), scores, 0.5)
+
+    agg = np.zeros((n, len(engine.out_universe)))
+    for k, mf in enumerate(engine.out_mfs):
+        np.maximum(agg, np.minimum(cut[:, k, None], mf), out=agg)
+
+    scores = _centroid(engine.out_universe, agg)
+    return np.where(np.isfinite(scores), scores, 0.5)
+
+
+# ------------------------------------------------------------
+# Single-sample inference
+# ------------------------------------------------------------
+@lru_cache(maxsize=4096)
+def score_sample(bmi: float, age: float, highbp: float, smoker: float,
+                 physact: float, highchol: float, heart: float,
+                 genhlth: float) -> float:
+    """Risk score for one normalized sample under the default system.
+
+    Memoized on the inputs; the process-wide simulation is thread-safe to
+    share because each evaluation holds _SIM_LOCK.
+    """
+    _, sim = get_or_build_system()
+    with _SIM_LOCK:
+        sim.reset()
+
+        sim.input['BMI'] = bmi
+        sim.input['Age'] = age
+        sim.input['HighBP'] = highbp
+        sim.input['Smoker'] = smoker
+        sim.input['PhysActivity'] = physact
+
+        sim.input['HighChol'] = highchol
+        sim.input['HeartDiseaseorAttack'] = heart
+        sim.input['GenHlth'] = genhlth
+
+        sim.compute()
+        return float(sim.output['Risk'])
+
+
 # ------------------------------------------------------------
 # Inference on dataset
 # ------------------------------------------------------------
-def compute_scores(sim: ctrl.ControlSystemSimulation, df: pd.DataFrame) -> np.ndarray:
-    scores = []
+BINARY_COLUMNS = ['HighBP', 'Smoker', 'PhysActivity', 'HighChol', 'HeartDiseaseorAttack']
+INPUT_COLUMNS = ['BMI', 'Age'] + BINARY_COLUMNS + ['GenHlth']
+TARGET_COLUMN = 'Diabetes_binary'
+
 
-    for _, row in df.iterrows():
+def compute_scores(sim: ctrl.ControlSystemSimulation, df: pd.DataFrame) -> np.ndarray:
+    engine = compile_system(sim.ctrl)
+    if any(c not in df.columns for c in engine.inputs):
+        # The per-row loop fails every row on the missing column
+        return np.full(len(df), 0.5)
+    X = np.column_stack([df[c].to_numpy(dtype=np.float64) for c in engine.inputs])
+
+    kernel = _fused_kernel()
+    if kernel is not None:
+        # The fused kernel only keeps per-row scratch, so it takes all rows at once
+        return kernel(X, *_kernel_args(engine))
+
+    scores = np.empty(len(df))
+    for start in range(0, len(df), BATCH_SIZE):
+        scores[start:start + BATCH_SIZE] = infer_batch(engine, X[start:start + BATCH_SIZE])
+    return scores
+
+
+def _score_chunk(system: ctrl.ControlSystem, clip_to_bounds: bool, lenient: bool,
+                 df: pd.DataFrame) -> np.ndarray:
+    # Runs in a worker process on a copy of the caller's ControlSystem;
+    # the simulation is rebuilt there with the caller's options.
+    sim = ctrl.ControlSystemSimulation(system, clip_to_bounds=clip_to_bounds,
+                                       lenient=lenient)
+    return compute_scores_skfuzzy(sim, df)
+
+
+def compute_scores_skfuzzy(sim: ctrl.ControlSystemSimulation, df: pd.DataFrame,
+                           n_jobs: int = 1) -> np.ndarray:
+    if n_jobs != 1:
+        from joblib import Parallel, delayed, effective_n_jobs
+
+        workers = effective_n_jobs(n_jobs)
+        size = max(1, len(df) // (4 * workers))
+        chunks = [df.iloc[i:i + size] for i in range(0, len(df), size)]
+        parts = Parallel(n_jobs=workers, backend='loky', batch_size='auto')(
+            delayed(_score_chunk)(sim.ctrl, sim.clip_to_bounds, sim.lenient, chunk)
+            for chunk in chunks
+        )
+        return np.concatenate(parts) if parts else np.empty(0)
+
+    # Columnar access: one array per input instead of a Series per row.
+    # A missing column fails every row into the 0.5 fallback, as before.
+    cols = {c: df[c].to_numpy(dtype=np.float64, copy=False)
+            for c in INPUT_COLUMNS if c in df.columns}
+    scores = np.empty(len(df))
+
+    inputs = sim.input
+
+    for i in range(len(df)):
         try:
+            # Reset per row: with no firing rule the lenient simulation
+            # leaves sim.output untouched, and a later cache hit on the same
+            # inputs would then return the previous row's score.
             sim.reset()
 
-            sim.input['BMI'] = float(row['BMI'])
-            sim.input['Age'] = float(row['Age'])
-            sim.input['HighBP'] = float(row['HighBP'])
-            sim.input['Smoker'] = float(row['Smoker'])
-            sim.input['PhysActivity'] = float(row['PhysActivity'])
+            inputs['BMI'] = float(cols['BMI'][i])
+            inputs['Age'] = float(cols['Age'][i])
+            inputs['HighBP'] = float(cols['HighBP'][i])
+            inputs['Smoker'] = float(cols['Smoker'][i])
+            inputs['PhysActivity'] = float(cols['PhysActivity'][i])
 
-            sim.input['HighChol'] = float(row['HighChol'])
-            sim.input['HeartDiseaseorAttack'] = float(row['HeartDiseaseorAttack'])
-            sim.input['GenHlth'] = float(row['GenHlth'])
+            inputs['HighChol'] = float(cols['HighChol'][i])
+            inputs['HeartDiseaseorAttack'] = float(cols['HeartDiseaseorAttack'][i])
+            inputs['GenHlth'] = float(cols['GenHlth'][i])
 
             sim.compute()
-            scores.append(float(sim.output['Risk']))
+            scores[i] = float(sim.output['Risk'])
 
         except Exception:
-            scores.append(0.5)
+            scores[i] = 0.5
+
+    return scores
+
+
+def read_dataset(path: str) -> pd.DataFrame:
+    """Load the model inputs and target from a CSV, skipping other columns.
+
+    The 0/1 flags are parsed straight to int8. A file where they hold
+    missing or fractional values is re-read with inferred dtypes instead.
+    """
+    import importlib.util
+
+    import pandas as pd
+
+    header = pd.read_csv(path, nrows=0).columns
+    usecols = [c for c in INPUT_COLUMNS + [TARGET_COLUMN] if c in header]
+    engine = 'pyarrow' if importlib.util.find_spec('pyarrow') is not None else 'c'
+    flags = {c: np.int8 for c in BINARY_COLUMNS + [TARGET_COLUMN] if c in usecols}
+    try:
+        return pd.read_csv(path, usecols=usecols, dtype=flags, engine=engine)
+    except ValueError:
+        return pd.read_csv(path, usecols=usecols, engine=engine)
+
+
+# ------------------------------------------------------------
+# Evaluation
+# ------------------------------------------------------------
+# Scores live in [0, 1] and thresholds are swept on a 0.02 grid, so one
+# byte per score (step 1/255) is plenty for the sweep and for storage.
+SCORE_SCALE = 255
+
+
+def quantize_scores(scores: np.ndarray) -> np.ndarray:
+    return np.round(np.clip(scores, 0.0, 1.0) * SCORE_SCALE).astype(np.uint8)
 
-    return np.asarray(scores)
+
+def confusion_sweep(y_true: np.ndarray, scores_u8: np.ndarray, thr_u8: np.ndarray):
+    """(tp, fp, fn, tn) of (scores_u8 >= thr) for every threshold at once.
+
+    Exact for byte scores: one 256-bin histogram of all rows and one of
+    the positives, reverse-cumsummed, give the counts at or above every
+    level in O(N + 256).
+    """
+    pos = y_true.astype(bool)
+    n_levels = SCORE_SCALE + 1
+    at_or_above = np.cumsum(np.bincount(scores_u8, minlength=n_levels)[::-1])[::-1]
+    pos_at_or_above = np.cumsum(np.bincount(scores_u8[pos], minlength=n_levels)[::-1])[::-1]
+    tp = pos_at_or_above[thr_u8]
+    fp = at_or_above[thr_u8] - tp
+    fn = np.count_nonzero(pos) - tp
+    tn = len(y_true) - tp - fp - fn
+    return tp, fp, fn, tn
 
 
 # ------------------------------------------------------------
 # Main
 # ------------------------------------------------------------
 def main():
+    import argparse
+    import time
+
+    from sklearn.metrics import (
+        accuracy_score,
+        precision_score,
+        recall_score,
+        f1_score,
+        confusion_matrix,
+    )
+
     parser = argparse.ArgumentParser()
     parser.add_argument('--data', default='../data/diabetes_clean.csv')
     parser.add_argument('--sample-size', type=int, default=30000)
     parser.add_argument('--metric', choices=['f1', 'accuracy'], default='f1')
     parser.add_argument('--threshold-grid', nargs=3, type=float, default=[0.2, 0.8, 0.02])
+    parser.add_argument('--engine', choices=['vectorized', 'skfuzzy'], default='vectorized')
+    parser.add_argument('--defuzzify', choices=['centroid', 'simplified'], default='centroid')
+    parser.add_argument('--n-jobs', type=int, default=1,
+                        help='worker processes for --engine skfuzzy (-1: all cores)')
     args = parser.parse_args()
+    if args.engine == 'skfuzzy' and args.defuzzify != 'centroid':
+        parser.error("--engine skfuzzy only supports --defuzzify centroid")
 
-    df = pd.read_csv(args.data)
+    df = read_dataset(args.data)
     df = df.sample(n=min(args.sample_size, len(df)), random_state=42)
 
-    _, sim = build_system()
+    _, sim = build_system(defuzzify_method=args.defuzzify)
 
     print("Running fuzzy inference...")
     t0 = time.time()
-    scores = compute_scores(sim, df)
+    if args.engine == 'skfuzzy':
+        scores = compute_scores_skfuzzy(sim, df, n_jobs=args.n_jobs)
+    else:
+        scores = compute_scores(sim, df)
     print(f"Done in {time.time()-t0:.2f}s")
 
-    y_true = df['Diabetes_binary'].astype(int).values
+    y_true = df[TARGET_COLUMN].astype(int).values
+
+    scores_u8 = quantize_scores(scores)
 
-    best_thr, best_f1 = 0.5, -1
-    for thr in np.arange(*args.threshold_grid):
-        f1 = f1_score(y_true, (scores >= thr).astype(int), zero_division=0)
-        if f1 > best_f1:
-            best_f1, best_thr = f1, thr
+    thresholds = np.arange(*args.threshold_grid)
+    tp, fp, fn, _ = confusion_sweep(y_true, scores_u8, quantize_scores(thresholds))
+    denom = 2 * tp + fp + fn
+    f1 = np.divide(2.0 * tp, denom, out=np.zeros(len(thresholds)), where=denom > 0)
+    best_thr = thresholds[np.argmax(f1)] if len(thresholds) else 0.5
 
-    y_pred = (scores >= best_thr).astype(int)
+    # Same decision rule as the sweep, so the reported metrics are the
+    # ones the threshold was chosen on
+    thr_u8 = quantize_scores(best_thr)
+    y_pred = (scores_u8 >= thr_u8).astype(int)
     cm = confusion_matrix(y_true, y_pred)
 
     print("\nCONFUSION MATRIX")
     print(cm)
     print("\nFINAL METRICS")
-    print(f"Threshold: {best_thr:.2f}")
+    print(f"Threshold: {thr_u8 / SCORE_SCALE:.4f} (grid {best_thr:.2f}, byte {thr_u8})")
     print(f"Accuracy:  {accuracy_score(y_true, y_pred):.4f}")
     print(f"Precision: {precision_score(y_true, y_pred, zero_division=0):.4f}")
     print(f"Recall:    {recall_score(y_true, y_pred, zero_division=0):.4f}")
     print(f"F1-score:  {f1_score(y_true, y_pred, zero_division=0):.4f}")
     np.save("fuzzy_scores.npy", scores)
+    np.save("fuzzy_scores_u8.npy", scores_u8)
     np.save("y_true.npy", y_true)
 
 
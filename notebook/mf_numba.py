@@ -0,0 +1,140 @@
+"""
+Numba-compiled kernels for the batch engine
+
+fuzzy_infer_batch runs the whole Mamdani pipeline row by row. Kernels
+are compiled eagerly from explicit signatures (and cached on disk) when
+this module is imported, which fuzzy_system.compute_scores does on its
+first call; the Streamlit app never loads it.
+"""
+
+import numpy as np
+from numba import boolean, float64, int64, njit, prange
+
+
+# ------------------------------------------------------------
+# Fused batch inference
+# ------------------------------------------------------------
+# fastmath without 'nnan'/'ninf', so missing (NaN) inputs stay detectable
+_FAST = {'nsz', 'arcp', 'contract', 'afn', 'reassoc'}
+
+
+@njit(float64(float64, float64[:], int64, float64[:, :], int64), cache=True)
+def _interp_row(x, universe, n_points, table, row):
+    # Same segment search and formula as fuzzy_memberships.membership
+    # (and so np.interp), for one term of one input. Kept
+    # strict (no fastmath): a contracted multiply-add turns the ~1e-16
+    # memberships at term edges into 0 or back, which moves some scores.
+    last = n_points - 1
+    lo, hi = universe[0], universe[last]
+    if hi == lo:
+        return table[row, 0]
+    x = min(max(x, lo), hi)
+    if x == hi:
+        return table[row, last]
+    j = min(int((x - lo) * (last / (hi - lo))), last - 1)
+    if j > 0 and x < universe[j]:
+        j -= 1
+    elif j < last - 1 and x >= universe[j + 1]:
+        j += 1
+    return ((table[row, j + 1] - table[row, j]) / (universe[j + 1] - universe[j])
+            * (x - universe[j]) + table[row, j])
+
+
+@njit(float64[:](float64[:, :], float64[:, :], int64[:], float64[:, :], int64[:], int64[:],
+                 boolean[:], int64[:, :], boolean[:, :], float64[:], float64[:, :],
+                 float64[:], boolean),
+      cache=True, parallel=True, fastmath=_FAST)
+def fuzzy_infer_batch(X, universes, n_points, tables, offsets, n_terms, binary,
+                      rule_terms, rule_out, out_universe, out_mfs, out_centroids,
+                      simplified):
+    """Risk scores for an (N, n_inputs) matrix in a single pass per row.
+
+    Fuses fuzzification, rule firing (min over rule_terms, -1 padded),
+    accumulation (max per output term) and defuzzification. Centroid
+    defuzzification integrates the aggregated output on the fly instead
+    of materializing it. As in skfuzzy, NaN memberships of missing inputs
+    are skipped by the min and the max; rows with no firing rule, or with
+    an output term left NaN, score 0.5.
+    """
+    n, n_in = X.shape
+    n_rules, max_len = rule_terms.shape
+    n_out, n_u = out_mfs.shape
+    n_cols = tables.shape[0]
+    scores = np.empty(n)
+    # Terms no rule concludes start (and stay) at 0; the rest start empty
+    concluded = np.zeros(n_out, dtype=np.bool_)
+    for r in range(n_rules):
+        for o in range(n_out):
+            if rule_out[r, o]:
+                concluded[o] = True
+
+    for i in prange(n):
+        # Per-row scratch: memberships of every term, cut of every output term
+        mem = np.empty(n_cols)
+        cut = np.empty(n_out)
+        for k in range(n_in):
+            x = X[i, k]
+            base = offsets[k]
+            if x != x:
+                for t in range(n_terms[k]):
+                    mem[base + t] = np.nan
+            elif binary[k] and (x == 0.0 or x == 1.0):
+                mem[base] = 1.0 - x
+                mem[base + 1] = x
+            else:
+                for t in range(n_terms[k]):
+                    mem[base + t] = _interp_row(x, universes[k], n_points[k], tables, base + t)
+
+        for o in range(n_out):
+            cut[o] = np.nan if concluded[o] else 0.0
+        for r in range(n_rules):
+            firing = np.nan
+            for m in range(max_len):
+                c = rule_terms[r, m]
+                if c < 0:
+                    break
+                v = mem[c]
+                if v == v and not v >= firing:
+                    firing = v
+                if firing == 0.0:
+                    # A zero antecedent term: the rest cannot lower it
+                    break
+            if firing != firing:
+                continue
+            for o in range(n_out):
+                if rule_out[r, o] and not cut[o] >= firing:
+                    cut[o] = firing
+
+        empty = False
+        for o in range(n_out):
+            if cut[o] != cut[o]:
+                empty = True
+        if empty:
+            scores[i] = 0.5
+            continue
+
+        if simplified:
+            num = 0.0
+            den = 0.0
+            for o in range(n_out):
+                num += cut[o] * out_centroids[o]
+                den += cut[o]
+            scores[i] = num / den if den > 0.0 else 0.5
+            continue
+
+        area = 0.0
+        moment = 0.0
+        y_prev = 0.0
+        for u in range(n_u):
+            y = 0.0
+            for o in range(n_out):
+                y = max(y, min(cut[o], out_mfs[o, u]))
+            if u > 0:
+                x1 = out_universe[u - 1]
+                x2 = out_universe[u]
+                dx = x2 - x1
+                area += dx * (y_prev + y)
+                moment += dx * (x1 * (2.0 * y_prev + y) + x2 * (y_prev + 2.0 * y))
+            y_prev = y
+        scores[i] = (moment / 6.0) / (area / 2.0) if area > 0.0 else 0.5
+    return scores
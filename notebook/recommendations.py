@@ -0,0 +1,121 @@
+"""
+Risk levels and personalized recommendations as data tables
+
+Every condition in RECS is written with array-friendly operators, so the
+same table serves one patient (generate_recommendations) and a whole
+batch (generate_recommendations_batch) as a boolean-matrix lookup.
+"""
+
+from types import SimpleNamespace
+
+import numpy as np
+
+# -------------------------------------------------
+# Risk levels
+# -------------------------------------------------
+RISK_CUTS = np.array([0.2, 0.4, 0.6, 0.8])
+
+RISK_LEVELS = np.array([
+    "🟢 Very Low",
+    "🟡 Low",
+    "🟠 Medium",
+    "🔴 High",
+    "⚫ Very High",
+])
+
+RISK_ADVICE = np.array([
+    "🟢 Maintain your current healthy lifestyle.",
+    "🟡 Monitor your health regularly and maintain healthy habits.",
+    "🟠 Lifestyle improvements are recommended to reduce diabetes risk.",
+    "🔴 High risk detected. Medical consultation is strongly recommended.",
+    "⚫ Very high risk detected. Immediate medical follow-up is advised.",
+])
+
+
+def risk_bucket(risk_score):
+    """Index into RISK_LEVELS / RISK_ADVICE (score < 0.2 -> 0, ..., >= 0.8 -> 4)."""
+    return np.searchsorted(RISK_CUTS, risk_score, side='right')
+
+
+def risk_level(risk_score):
+    return str(RISK_LEVELS[risk_bucket(risk_score)])
+
+
+# -------------------------------------------------
+# Factor-specific and protective recommendations (in display order)
+# -------------------------------------------------
+RECS = [
+    (lambda c: c.bmi >= 30,
+     "⚠️ BMI indicates obesity. Weight management through diet and exercise is recommended."),
+    (lambda c: (c.bmi >= 25) & (c.bmi < 30),
+     "⚠️ BMI indicates overweight. Gradual weight reduction is advised."),
+    (lambda c: c.highbp == 1,
+     "⚠️ High blood pressure detected. Reduce salt intake and consult a healthcare provider."),
+    (lambda c: c.smoker == 1,
+     "⚠️ Smoking increases insulin resistance. Smoking cessation is strongly advised."),
+    (lambda c: c.physact == 0,
+     "⚠️ Low physical activity detected. At least 150 minutes of moderate exercise per week is recommended."),
+    (lambda c: c.highchol == 1,
+     "⚠️ High cholesterol detected. Dietary fat reduction and medical advice are recommended."),
+    (lambda c: c.heart == 1,
+     "⚠️ History of heart disease significantly increases diabetes risk. Regular medical monitoring is essential."),
+    (lambda c: np.isin(c.genhlth_label, ["Fair", "Poor"]),
+     "⚠️ Poor general health reported. A comprehensive health evaluation is recommended."),
+    (lambda c: (c.smoker == 0) & (c.physact == 1) & (c.bmi < 25),
+     "✅ Protective factors detected: non-smoker, active lifestyle, and healthy BMI."),
+]
+
+MESSAGES = np.array([msg for _, msg in RECS])
+
+
+def _context(bmi_real, highbp, smoker, physact, highchol, heart, genhlth_label):
+    return SimpleNamespace(
+        bmi=np.asarray(bmi_real),
+        highbp=np.asarray(highbp),
+        smoker=np.asarray(smoker),
+        physact=np.asarray(physact),
+        highchol=np.asarray(highchol),
+        heart=np.asarray(heart),
+        genhlth_label=np.asarray(genhlth_label),
+    )
+
+
+def generate_recommendations(
+    risk_score,
+    bmi_real,
+    age_real,
+    highbp,
+    smoker,
+    physact,
+    highchol,
+    heart,
+    genhlth_label
+):
+    ctx = _context(bmi_real, highbp, smoker, physact, highchol, heart, genhlth_label)
+    recs = [str(RISK_ADVICE[risk_bucket(risk_score)])]
+    recs += [msg for cond, msg in RECS if cond(ctx)]
+    return recs
+
+
+def generate_recommendations_batch(
+    risk_score,
+    bmi_real,
+    age_real,
+    highbp,
+    smoker,
+    physact,
+    highchol,
+    heart,
+    genhlth_label
+):
+    """Recommendations for N patients from (N,) input arrays.
+
+    Returns the (N,) risk advice array, the (N, len(RECS)) condition
+    matrix and, per patient, the same message list as
+    generate_recommendations.
+    """
+    ctx = _context(bmi_real, highbp, smoker, physact, highchol, heart, genhlth_label)
+    advice = RISK_ADVICE[risk_bucket(np.asarray(risk_score))]
+    conditions = np.stack([np.broadcast_to(cond(ctx), advice.shape) for cond, _ in RECS], axis=1)
+    recs = [[str(a)] + MESSAGES[row].tolist() for a, row in zip(advice, conditions)]
+    return advice, conditions, recs